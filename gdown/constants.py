@@ -2,21 +2,22 @@
 A file contains all constant values
 """
 
+import os
+import re
+
 MAX_NUMBER_FILES = 50
 
-CHUNK_SIZE = 512 * 1024  # 512KB
+# Streaming chunk size in bytes; overridable via GDOWN_CHUNK_SIZE.
+CHUNK_SIZE = int(os.environ.get("GDOWN_CHUNK_SIZE", 1024 * 1024))  # 1MB
 
 
-PARSING_PATTERNS = [
-    r"^/file/d/(.*?)/(edit|view)$",
-    r"^/file/u/[0-9]+/d/(.*?)/(edit|view)$",
-    r"^/document/d/(.*?)/(edit|htmlview|view)$",
-    r"^/document/u/[0-9]+/d/(.*?)/(edit|htmlview|view)$",
-    r"^/presentation/d/(.*?)/(edit|htmlview|view)$",
-    r"^/presentation/u/[0-9]+/d/(.*?)/(edit|htmlview|view)$",
-    r"^/spreadsheets/d/(.*?)/(edit|htmlview|view)$",
-    r"^/spreadsheets/u/[0-9]+/d/(.*?)/(edit|htmlview|view)$",
-]
+# All supported Drive/Docs URL path shapes collapsed into one alternation,
+# compiled once at import, so parse_url() runs a single match per URL
+# instead of trying up to eight patterns.
+COMBINED_PARSING_PATTERN = re.compile(
+    r"^/(?:file|document|presentation|spreadsheets)"
+    r"(?:/u/[0-9]+)?/d/(?P<id>[^/]+)/(?:edit|htmlview|view)$"
+)
 
 
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36"
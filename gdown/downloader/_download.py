@@ -1,4 +1,6 @@
+import datetime
 import email.utils
+import functools
 import re
 import shutil
 import sys
@@ -6,9 +8,10 @@ import tempfile
 import textwrap
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from http.cookiejar import MozillaCookieJar
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import bs4
 import httpx
@@ -16,11 +19,31 @@ import tqdm
 
 from gdown.constants import CHUNK_SIZE, USER_AGENT
 from gdown.exceptions import FileURLRetrievalError
-from gdown.helpers import indent, parse_url, setup_logger
+from gdown.helpers import indent, is_google_drive_url, parse_url, setup_logger
 from gdown.models import GdownRsp
 
 logger = setup_logger(name="[gdown-logger|>")
 
+# Confirmation-page patterns, compiled once instead of per line of HTML.
+_RE_UC_HREF = re.compile(r'href="(\/uc\?export=download[^"]+)')
+_RE_DOWNLOAD_URL = re.compile(r'"downloadUrl":"([^"]+)')
+_RE_ERROR_CAPTION = re.compile(r'<p class="uc-error-subcaption">(.*)</p>')
+_RE_FILENAME_UTF8 = re.compile(r"filename\*=UTF-8''(.*)")
+_RE_FILENAME_ATTACHMENT = re.compile(r'attachment; filename="(.*?)"')
+
+# Files below this size are fetched with a single stream; the extra
+# connections of a parallel download only pay off on large transfers.
+PARALLEL_MIN_SIZE = 32 * 1024 * 1024  # 32MB
+PARALLEL_WORKERS = 4
+
+
+def _make_soup(markup: str) -> bs4.BeautifulSoup:
+    """Builds a soup with the faster lxml parser, falling back to html.parser."""
+    try:
+        return bs4.BeautifulSoup(markup, features="lxml")
+    except bs4.FeatureNotFound:
+        return bs4.BeautifulSoup(markup, features="html.parser")
+
 
 def get_url_from_gdrive_confirmation(contents: str) -> str:
     """Extracts the direct download URL from Google Drive's confirmation page.
@@ -34,74 +57,110 @@ def get_url_from_gdrive_confirmation(contents: str) -> str:
     Raises:
     FileURLRetrievalError: If the file URL cannot be retrieved.
     """
-    url = ""
-    for line in contents.splitlines():
-        m = re.search(r'href="(\/uc\?export=download[^"]+)', line)
-        if m:
-            url = "https://docs.google.com" + m.groups()[0]
-            url = url.replace("&amp;", "&")
-            break
-
-        soup = bs4.BeautifulSoup(line, features="html.parser")
+    # The URL sources are mutually exclusive in practice, so scan the whole
+    # document once per pattern instead of re-running every pattern per line,
+    # and keep whichever candidate appears earliest in the page.
+    candidates = []
+
+    m = _RE_UC_HREF.search(contents)
+    if m:
+        url = "https://docs.google.com" + m.group(1)
+        candidates.append((m.start(), url.replace("&amp;", "&")))
+
+    m = _RE_DOWNLOAD_URL.search(contents)
+    if m:
+        url = m.group(1).replace("\\u003d", "=").replace("\\u0026", "&")
+        candidates.append((m.start(), url))
+
+    # Only the form branch needs a soup, and only when the form is present.
+    form_pos = contents.find("download-form")
+    if form_pos != -1:
+        soup = _make_soup(contents)
         form = soup.select_one("#download-form")
         if form is not None:
             url = form["action"].replace("&amp;", "&")
             url_components = urllib.parse.urlsplit(url)
             query_params = urllib.parse.parse_qs(url_components.query)
-            for param in form.findChildren("input", attrs={"type": "hidden"}):
-                query_params[param["name"]] = param["value"]
+            query_params.update(
+                {
+                    param["name"]: param["value"]
+                    for param in form.find_all("input", attrs={"type": "hidden"})
+                }
+            )
             query = urllib.parse.urlencode(query_params, doseq=True)
             url = urllib.parse.urlunsplit(url_components._replace(query=query))
-            break
-
-        m = re.search('"downloadUrl":"([^"]+)', line)
-        if m:
-            url = m.groups()[0]
-            url = url.replace("\\u003d", "=").replace("\\u0026", "&")
-            break
-
-        m = re.search('<p class="uc-error-subcaption">(.*)</p>', line)
-        if m:
-            error = m.groups()[0]
-            raise FileURLRetrievalError(error)
-
-    if not url:
-        raise FileURLRetrievalError(
-            "Cannot retrieve the public link of the file. "
-            "You may need to change the permission to "
-            "'Anyone with the link', or have had many accesses. "
-        )
-    return url
+            candidates.append((form_pos, url))
+
+    if candidates:
+        return min(candidates)[1]
+
+    m = _RE_ERROR_CAPTION.search(contents)
+    if m:
+        raise FileURLRetrievalError(m.group(1))
+
+    raise FileURLRetrievalError(
+        "Cannot retrieve the public link of the file. "
+        "You may need to change the permission to "
+        "'Anyone with the link', or have had many accesses. "
+    )
 
 
 def _get_filename_from_response(response: httpx.Response) -> Optional[str]:
     """Extracts the filename from the HTTP response headers."""
-    content_disposition = urllib.parse.unquote(
-        response.headers.get("Content-Disposition", "")
-    )
+    content_disposition = response.headers.get("Content-Disposition", "")
+    if "filename" not in content_disposition:
+        return None
+    # unquote is a no-op (but still a full scan+copy) without %-escapes.
+    if "%" in content_disposition:
+        content_disposition = urllib.parse.unquote(content_disposition)
 
-    m = re.search(r"filename\*=UTF-8''(.*)", content_disposition)
+    m = _RE_FILENAME_UTF8.search(content_disposition)
     if m:
-        return m.groups()[0].replace("/", "_")
+        return m.group(1).replace("/", "_")
 
-    m = re.search('attachment; filename="(.*?)"', content_disposition)
+    m = _RE_FILENAME_ATTACHMENT.search(content_disposition)
     if m:
-        return m.groups()[0]
+        return m.group(1)
 
     return None
 
 
 def _get_modified_time_from_response(
     response: httpx.Response,
-) -> Optional[email.utils.datetime]:
+) -> Optional[datetime.datetime]:
     """Extracts the last modified time from the HTTP response headers."""
     if "Last-Modified" not in response.headers:
         return None
     return email.utils.parsedate_to_datetime(response.headers["Last-Modified"])
 
 
+def _cookies_snapshot(client: Union[httpx.Client, httpx.AsyncClient]) -> tuple:
+    """Returns a comparable snapshot of the client's current cookies.
+
+    Iterating httpx.Cookies yields names only, so go through the
+    underlying jar, which yields full Cookie objects.
+    """
+    return tuple(sorted((c.name, c.value, c.domain) for c in client.cookies.jar))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cookie_jar(path: str, mtime_ns: int) -> MozillaCookieJar:
+    """Loads and parses the cookies file once per (path, mtime).
+
+    The mtime key invalidates the cache whenever the file is rewritten, so
+    repeated sessions in a batch download reuse the parsed jar.
+    """
+    cookie_jar = MozillaCookieJar(path)
+    cookie_jar.load()
+    return cookie_jar
+
+
 def _get_session(
-    proxy: Optional[str], use_cookies: bool, user_agent: str, verbose: bool = True
+    proxy: Optional[str],
+    use_cookies: bool,
+    user_agent: str,
+    verify: bool = True,
+    verbose: bool = True,
 ) -> Tuple[httpx.Client, Path]:
     """Creates an HTTP session for downloading files.
 
@@ -109,6 +168,7 @@ def _get_session(
     proxy (Optional[str]): Proxy URL.
     use_cookies (bool): Whether to use stored cookies.
     user_agent (str): The user-agent string for the request.
+    verify (bool): Whether to verify SSL certificates.
     verbose (bool): Whether to log session details.
 
     Returns:
@@ -116,17 +176,87 @@ def _get_session(
     """
     if verbose:
         logger.info(f"Proxy: {proxy} Cookies: {use_cookies} User-Agent: {user_agent} ")
-    client = httpx.Client(headers={"User-Agent": user_agent}, proxies=proxy)
+    # verify and follow_redirects live on the client: httpx does not accept
+    # them per request, and following redirects here keeps the headers the
+    # HEAD pre-flight inspects consistent with what the GETs fetch.
+    client = httpx.Client(
+        headers={"User-Agent": user_agent},
+        proxy=proxy,
+        verify=verify,
+        follow_redirects=True,
+    )
 
     cookies_file = Path.home() / ".cache/gdown/cookies.txt"
     if use_cookies and cookies_file.exists():
-        cookie_jar = MozillaCookieJar(str(cookies_file))
-        cookie_jar.load()
+        cookie_jar = _load_cookie_jar(
+            str(cookies_file), cookies_file.stat().st_mtime_ns
+        )
         client.cookies.update(cookie_jar)
 
     return client, cookies_file
 
 
+def _download_range(
+    client: httpx.Client,
+    url: str,
+    path: Path,
+    start: int,
+    end: int,
+    chunk_size: int,
+    pbar: tqdm.tqdm,
+) -> None:
+    """Fetches bytes [start, end] of `url` and writes them at `start` in `path`."""
+    with client.stream(
+        "GET", url, headers={"Range": f"bytes={start}-{end}"}
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            # A 200 carries the whole file; writing it at this offset
+            # would silently corrupt the output.
+            raise FileURLRetrievalError(
+                f"Server ignored the Range request for bytes {start}-{end} "
+                f"(got HTTP {response.status_code})"
+            )
+        with path.open("r+b") as f:
+            f.seek(start)
+            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                f.write(chunk)
+                pbar.update(len(chunk))
+
+
+def _download_parallel(
+    client: httpx.Client,
+    url: str,
+    path: Path,
+    total: int,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = PARALLEL_WORKERS,
+) -> None:
+    """Downloads `total` bytes of `url` into `path` with concurrent Range requests.
+
+    The file is preallocated and each worker writes its slice at the correct
+    offset, so the result is identical to a single-stream download.
+    """
+    with path.open("wb") as f:
+        f.truncate(total)
+
+    part_size = -(-total // workers)  # ceil division
+    ranges = [
+        (start, min(start + part_size, total) - 1)
+        for start in range(0, total, part_size)
+    ]
+
+    with tqdm.tqdm(
+        total=total, unit="B", unit_scale=True, mininterval=0.5
+    ) as pbar, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_download_range, client, url, path, s, e, chunk_size, pbar)
+            for s, e in ranges
+        ]
+        for future in futures:
+            future.result()
+
+
 def download(
     url: str,
     output: Optional[Path] = None,
@@ -134,6 +264,8 @@ def download(
     use_cookies: bool = True,
     verify: bool = True,
     user_agent: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = False,
 ) -> GdownRsp:
     """Downloads a file from a given URL and saves it to a specified location.
 
@@ -145,6 +277,9 @@ def download(
     use_cookies (bool): Whether to use stored cookies.
     verify (bool): Whether to verify SSL certificates.
     user_agent (Optional[str]): The user-agent string for the request.
+    chunk_size (int): Bytes per streamed chunk. Defaults to CHUNK_SIZE.
+    resume (bool): Whether to resume from an existing partial file via an
+        HTTP Range request. Requires `output` and server Range support.
 
     Returns:
     GdownRsp: The path of the downloaded file.
@@ -152,11 +287,65 @@ def download(
     if not user_agent:
         user_agent = USER_AGENT
 
+    # The partial file can only be located up-front when the caller gave an
+    # explicit output file; otherwise the filename depends on the response.
+    resume_from = 0
+    headers = {}
+    if resume and output is not None and not Path(output).is_dir():
+        partial = Path(output).with_suffix(".part")
+        if partial.is_file():
+            resume_from = partial.stat().st_size
+        if resume_from:
+            headers["Range"] = f"bytes={resume_from}-"
+
     try:
         start_time = time.perf_counter()
-        client, cookies_file = _get_session(proxy, use_cookies, user_agent)
-        response = client.get(url, stream=True, verify=verify)
-        response.raise_for_status()
+        client, cookies_file = _get_session(proxy, use_cookies, user_agent, verify)
+        cookies_before = _cookies_snapshot(client) if use_cookies else ()
+
+        head = client.head(url)
+
+        # Large Google Drive files answer with an HTML confirmation page
+        # instead of the file bytes. The HEAD tells us up-front, so we can
+        # resolve the real download URL rather than saving the HTML.
+        if is_google_drive_url(url) and "text/html" in head.headers.get(
+            "Content-Type", ""
+        ):
+            page = client.get(url)
+            page.raise_for_status()
+            url = get_url_from_gdrive_confirmation(page.text)
+            head = client.head(url)
+
+        total = int(head.headers.get("Content-Length", 0))
+        parallel = (
+            not resume_from
+            and head.status_code == 200
+            and head.headers.get("Accept-Ranges") == "bytes"
+            and total >= PARALLEL_MIN_SIZE
+        )
+
+        # A partial that already covers the whole file has nothing left to
+        # fetch; asking for bytes past the end would only draw a 416.
+        already_complete = bool(resume_from and total and resume_from >= total)
+
+        if parallel or already_complete:
+            # The HEAD response carries the headers we need (filename,
+            # mtime); the body comes from the ranged workers or the
+            # existing partial file.
+            response = head
+        else:
+            # httpx has no stream= kwarg on get(); build the request and
+            # send it with streaming enabled so the body is not buffered.
+            response = client.send(
+                client.build_request("GET", url, headers=headers), stream=True
+            )
+            if resume_from and response.status_code == 416:
+                # Requested range starts at the end: the partial is
+                # already the complete file, so just finalize it.
+                already_complete = True
+                response.close()
+            else:
+                response.raise_for_status()
     except httpx.HTTPError as e:
         logger.error(f"Failed to connect to {url}: {e}")
         raise FileURLRetrievalError(f"Failed to retrieve file from {url}")
@@ -171,20 +360,38 @@ def download(
 
         temp_file = output.with_suffix(".part")
 
-        with temp_file.open("wb") as f, tqdm.tqdm(
-            total=int(response.headers.get("Content-Length", 0)),
-            unit="B",
-            unit_scale=True,
-        ) as pbar:
-            for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
-                f.write(chunk)
-                pbar.update(len(chunk))
+        if already_complete:
+            pass  # nothing to fetch; the rename below finalizes the partial
+        elif parallel:
+            _download_parallel(client, url, temp_file, total, chunk_size)
+        else:
+            # Append to the partial file only if the server honored the
+            # Range request; a 200 means it sent the file from the start.
+            if resume_from and response.status_code != 206:
+                resume_from = 0
+
+            # tqdm.wrapattr hooks the write call itself, so the copy loop
+            # does not need to track progress explicitly per chunk.
+            with temp_file.open("ab" if resume_from else "wb") as f, tqdm.tqdm.wrapattr(
+                f,
+                "write",
+                total=resume_from + int(response.headers.get("Content-Length", 0)),
+                initial=resume_from,
+                unit="B",
+                unit_scale=True,
+                mininterval=0.5,
+            ) as wrapped:
+                for chunk in response.iter_bytes(chunk_size=chunk_size):
+                    wrapped.write(chunk)
+            response.close()
 
         temp_file.rename(output)
 
-        if use_cookies:
+        # Only rewrite cookies.txt if the server actually set something;
+        # otherwise the save is pure I/O waste in batch downloads.
+        if use_cookies and _cookies_snapshot(client) != cookies_before:
             cookie_jar = MozillaCookieJar(str(cookies_file))
-            for cookie in client.cookies:
+            for cookie in client.cookies.jar:
                 cookie_jar.set_cookie(cookie)
             cookie_jar.save()
 
@@ -199,6 +406,8 @@ def download(
         return resp
     except Exception as e:
         logger.error(f"Download failed: {e}")
-        if temp_file.exists():
+        # Keep the partial file around when resuming so the next attempt
+        # can pick up where this one stopped.
+        if not resume and temp_file.exists():
             temp_file.unlink()
         raise FileURLRetrievalError(f"Download failed due to {e}")
@@ -1,19 +1,35 @@
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Union
+import asyncio
+import time
+from http.cookiejar import MozillaCookieJar
+from pathlib import Path
+from typing import List, Optional, Union
 
+import httpx
+import tqdm
+
+from gdown.constants import CHUNK_SIZE, USER_AGENT
+from gdown.downloader._download import _cookies_snapshot
+from gdown.downloader._download import _get_filename_from_response
+from gdown.downloader._download import _get_modified_time_from_response
+from gdown.downloader._download import _load_cookie_jar
 from gdown.downloader._download import download
+from gdown.downloader._download import get_url_from_gdrive_confirmation
 from gdown.downloader.factory import BaseDownloader, DownloaderFactory
-from gdown.helpers import setup_logger
+from gdown.helpers import is_google_drive_url, setup_logger
 from gdown.models import GdownRsp
 
 logger = setup_logger("[FilesDownloader]")
 
+# Cap concurrent transfers so batch downloads stay below Google's
+# per-host throttling threshold.
+MAX_CONCURRENT_DOWNLOADS = 8
+
 
 @DownloaderFactory.register_class(type_names="file(s)")
 class FilesDownloader(BaseDownloader):
     def download(
         self,
-        url: Union[str, list[str]],
+        url: Union[str, List[str]],
         output: str,
         proxy: Optional[str] = None,
         use_cookies: bool = True,
@@ -23,6 +39,9 @@ class FilesDownloader(BaseDownloader):
         """
         Downloads a file or multiple files from a given URL using gdown.
 
+        Multiple URLs are fetched concurrently over a single shared async
+        client, so connections to the same host are reused across files.
+
         :param url: Single URL or list of URLs.
         :param output: Output file path or directory.
         :param proxy: Proxy setting.
@@ -35,19 +54,117 @@ class FilesDownloader(BaseDownloader):
             if isinstance(url, str):
                 return download(url, output, proxy, use_cookies, verify, user_agent)
             elif isinstance(url, list):
-                with ThreadPoolExecutor() as executor:
-                    results = list(
-                        executor.map(
-                            lambda u: download(
-                                u, output, proxy, use_cookies, verify, user_agent
-                            ),
-                            url,
-                        )
+                return asyncio.run(
+                    self._adownload_all(
+                        url, output, proxy, use_cookies, verify, user_agent
                     )
-                return results
+                )
             else:
                 logger.error("Invalid URL type. Expected str or list[str].")
                 return None
         except Exception as e:
             logger.error(f"Download failed: {e}")
             return None
+
+    async def _adownload_all(
+        self,
+        urls: List[str],
+        output: str,
+        proxy: Optional[str],
+        use_cookies: bool,
+        verify: bool,
+        user_agent: Optional[str],
+    ) -> List[GdownRsp]:
+        """Downloads all URLs concurrently over one shared async client."""
+        max_concurrency = max(1, min(MAX_CONCURRENT_DOWNLOADS, len(urls)))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with httpx.AsyncClient(
+            headers={"User-Agent": user_agent or USER_AGENT},
+            proxy=proxy,
+            verify=verify,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_concurrency),
+        ) as client:
+            cookies_file = Path.home() / ".cache/gdown/cookies.txt"
+            if use_cookies and cookies_file.exists():
+                cookie_jar = _load_cookie_jar(
+                    str(cookies_file), cookies_file.stat().st_mtime_ns
+                )
+                client.cookies.update(cookie_jar)
+            cookies_before = _cookies_snapshot(client) if use_cookies else ()
+
+            results = await asyncio.gather(
+                *[self._adownload(client, semaphore, u, output) for u in urls]
+            )
+
+            # Mirror the sync path: persist cookies once per batch, and
+            # only when the servers actually set something.
+            if use_cookies and _cookies_snapshot(client) != cookies_before:
+                cookie_jar = MozillaCookieJar(str(cookies_file))
+                for cookie in client.cookies.jar:
+                    cookie_jar.set_cookie(cookie)
+                cookie_jar.save()
+
+            return results
+
+    async def _adownload(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        output: str,
+    ) -> GdownRsp:
+        """Downloads one URL over the shared async client."""
+        async with semaphore:
+            start_time = time.perf_counter()
+
+            head = await client.head(url)
+            if is_google_drive_url(url) and "text/html" in head.headers.get(
+                "Content-Type", ""
+            ):
+                page = await client.get(url)
+                page.raise_for_status()
+                url = get_url_from_gdrive_confirmation(page.text)
+
+            temp_file = None
+            try:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    total_time = time.perf_counter() - start_time
+
+                    filename_from_url = (
+                        _get_filename_from_response(response) or Path(url).name
+                    )
+                    last_modified = _get_modified_time_from_response(response)
+                    out = Path(output or filename_from_url)
+                    if out.is_dir():
+                        out /= filename_from_url
+
+                    temp_file = out.with_suffix(".part")
+                    with temp_file.open("wb") as f, tqdm.tqdm.wrapattr(
+                        f,
+                        "write",
+                        total=int(response.headers.get("Content-Length", 0)),
+                        unit="B",
+                        unit_scale=True,
+                        mininterval=0.5,
+                    ) as wrapped:
+                        async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                            wrapped.write(chunk)
+
+                temp_file.rename(out)
+            except Exception:
+                # Same cleanup as the sync path: do not leave a partial
+                # file behind on failure.
+                if temp_file is not None and temp_file.exists():
+                    temp_file.unlink()
+                raise
+
+            logger.info(f"Download successful: {out}")
+
+            return GdownRsp(
+                url=url,
+                output=str(out),
+                last_modified=last_modified,
+                total_time=str(total_time),
+            )
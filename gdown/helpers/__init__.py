@@ -1,4 +1,5 @@
 from gdown.helpers.extract_all import extract_all  # noqa
 from gdown.helpers.logging_config import setup_logger  # noqa
+from gdown.helpers.parse_url import is_google_drive_url  # noqa
 from gdown.helpers.parse_url import parse_url  # noqa
 from gdown.helpers.utils import indent  # noqa
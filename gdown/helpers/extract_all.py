@@ -18,27 +18,31 @@ def extract_all(path: str, to: str = None):
     to = Path(to) if to else path.parent
 
     if path.suffix == ".zip":
-        opener, mode = zipfile.ZipFile, "r"
+        mode = None
     elif path.suffix == ".tar":
-        opener, mode = tarfile.open, "r"
-    elif path.suffixes[-2:] in [(".tar", ".gz"), (".tgz",)]:
-        opener, mode = tarfile.open, "r:gz"
-    elif path.suffixes[-2:] in [(".tar", ".bz2"), (".tbz",)]:
-        opener, mode = tarfile.open, "r:bz2"
+        mode = "r|"
+    elif path.suffixes[-2:] == [".tar", ".gz"] or path.suffix == ".tgz":
+        mode = "r|gz"
+    elif path.suffixes[-2:] == [".tar", ".bz2"] or path.suffix == ".tbz":
+        mode = "r|bz2"
     else:
         raise ValueError(
             f"Could not extract '{path}' as no appropriate extractor is found"
         )
 
-    def namelist(f):
-        if isinstance(f, zipfile.ZipFile):
-            return f.namelist()
-        return [m.name for m in f.getmembers()]
-
-    def filelist(f):
-        return [str(to / fname) for fname in namelist(f)]
-
-    with opener(path, mode) as f:
-        f.extractall(path=to)
-
-    return filelist(f)
+    names = []
+    if mode is None:
+        # The zip central directory is read once and reused for both the
+        # extraction and the returned file list.
+        with zipfile.ZipFile(path) as f:
+            names = f.namelist()
+            f.extractall(path=to)
+    else:
+        # Stream mode ("r|*") walks the members sequentially, extracting
+        # as it goes, so memory stays O(1) instead of O(members).
+        with tarfile.open(path, mode) as f:
+            for member in f:
+                names.append(member.name)
+                f.extract(member, path=to)
+
+    return [str(to / name) for name in names]
@@ -1,11 +1,12 @@
-import re
+import functools
 import urllib.parse
 import warnings
 from typing import Tuple, Union
 
-from gdown.constants import PARSING_PATTERNS
+from gdown.constants import COMBINED_PARSING_PATTERN
 
 
+@functools.lru_cache(maxsize=1024)
 def is_google_drive_url(url: str) -> bool:
     """Check if a given URL belongs to Google Drive.
 
@@ -23,6 +24,29 @@ def is_google_drive_url(url: str) -> bool:
     return parsed.hostname in ["drive.google.com", "docs.google.com"]
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_file_id(url: str) -> Tuple[Union[str, None], bool]:
+    """Pure parsing half of parse_url, cached per URL."""
+    parsed = urllib.parse.urlparse(url)
+    query = urllib.parse.parse_qs(parsed.query)
+    is_download_link = parsed.path.endswith("/uc")
+
+    if not is_google_drive_url(url):
+        return None, is_download_link
+
+    file_id: Union[str, None] = None
+    if "id" in query:
+        file_ids = query["id"]
+        if len(file_ids) == 1:
+            file_id = file_ids[0]
+    else:
+        match = COMBINED_PARSING_PATTERN.match(parsed.path)
+        if match:
+            file_id = match.group("id")
+
+    return file_id, is_download_link
+
+
 def parse_url(url: str, warning: bool = True) -> Tuple[Union[str, None], bool]:
     """Parse a URL to extract Google Drive file ID and check if it is a download link.
 
@@ -41,27 +65,11 @@ def parse_url(url: str, warning: bool = True) -> Tuple[Union[str, None], bool]:
         is_download_link : bool
             True if the URL is a direct download link, otherwise False.
     """
-    parsed = urllib.parse.urlparse(url)
-    query = urllib.parse.parse_qs(parsed.query)
-    is_gdrive = is_google_drive_url(url=url)
-    is_download_link = parsed.path.endswith("/uc")
-
-    if not is_gdrive:
-        return None, is_download_link
-
-    file_id: Union[str, None] = None
-    if "id" in query:
-        file_ids = query["id"]
-        if len(file_ids) == 1:
-            file_id = file_ids[0]
-    else:
-        for pattern in PARSING_PATTERNS:
-            match = re.match(pattern, parsed.path)
-            if match:
-                file_id = match.groups()[0]
-                break
+    # The parsing itself is cached; the warning stays out here so it still
+    # fires on repeated calls for the same URL.
+    file_id, is_download_link = _parse_file_id(url)
 
-    if warning and not is_download_link:
+    if warning and is_google_drive_url(url) and not is_download_link:
         warnings.warn(
             "You specified a Google Drive link that is not the correct link "
             "to download a file. You might want to try `--fuzzy` option "
@@ -1,3 +1,6 @@
+import textwrap
+
+
 def indent(text: str, prefix: str) -> str:
     """Indent each line of a given text with a specified prefix.
 
@@ -13,9 +16,6 @@ def indent(text: str, prefix: str) -> str:
     str
         The indented text with the prefix applied to each non-empty line.
     """
-
-    def prefixed_lines() -> str:
-        for line in text.splitlines(True):
-            yield (prefix + line if line.strip() else line)
-
-    return "".join(prefixed_lines())
+    # textwrap.indent's default predicate skips whitespace-only lines,
+    # matching the previous hand-rolled generator without its overhead.
+    return textwrap.indent(text, prefix)